@@ -17,6 +17,9 @@ Usage:
     # To generate the third party licenses file:
     python build.py --third-party-licenses
 
+    # To generate the pre-sized GUI icons:
+    python build.py --generate-icons
+
 Arguments:
     --build TYPE            Specify the build type: "gui" or "headless"
     --clean                 Delete previous build and dist directories before building
@@ -24,6 +27,7 @@ Arguments:
     --upx-clean             Delete the UPX directory in build_resources after building
     --insert-docstrings     Insert docstrings into .py source files (does not build EXEs)
     --third-party-licenses  Generate third-party licenses file (does not build EXEs)
+    --generate-icons        Generate pre-sized GUI icons (does not build EXEs)
 
 The script handles platform differences for UPX download URLs and extraction.
 """
@@ -37,6 +41,7 @@ import tarfile
 import argparse
 
 from build_resources.generate_docstrings import insert_docstrings
+from build_resources.generate_icons import generate_icons
 from build_resources.generate_third_party_licenses import generate_third_party_licenses
 
 DEFAULT_UPX_VER="5.0.1"
@@ -111,6 +116,15 @@ def build_exe(spec_file: str, upx_dir: str, dist_dir: str, build_dir: str) -> No
     ], check=True)
 
 
+def generate_gui_icons() -> None:
+    """
+    Generates the pre-sized GUI icons without building.
+    """
+
+    print("Generating pre-sized GUI icons...")
+    generate_icons()
+
+
 def main(
         build_type: str,
         clean_build: bool,
@@ -227,13 +241,23 @@ if __name__ == "__main__":
         help="Generate third-party licenses file instead of building"
     )
 
+    parser.add_argument(
+        "--generate-icons",
+        action="store_true",
+        help="Generate pre-sized GUI icons instead of building"
+    )
+
     args = parser.parse_args()
 
-    main(
-        build_type=args.build,
-        clean_build=args.clean,
-        clean_upx=args.upx_clean,
-        upx_ver=args.upx,
-        insert_docstrings_only=args.insert_docstrings,
-        third_party_licenses_only=args.third_party_licenses
-    )
+    # Handle generating icons only (no build)
+    if args.generate_icons:
+        generate_gui_icons()
+    else:
+        main(
+            build_type=args.build,
+            clean_build=args.clean,
+            clean_upx=args.upx_clean,
+            upx_ver=args.upx,
+            insert_docstrings_only=args.insert_docstrings,
+            third_party_licenses_only=args.third_party_licenses
+        )
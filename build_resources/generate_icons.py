@@ -0,0 +1,52 @@
+"""
+Automatically generate pre-sized GUI icons.
+
+The GUI displays its icons at fixed sizes, resizing them once here means the
+app only has to load them at runtime.
+"""
+import os
+
+from PIL import Image
+
+
+ICONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "src", "gui", "assets", "icons"
+)
+
+# Source icon and the widths it is displayed at
+ICON_SIZES = {
+    "linux.png": (18,),
+    "windows.png": (14,),
+    "psmonitor.png": (32,),
+}
+
+
+def resize_icon(filename, width):
+    """
+    Resize an icon to the given width, keeping its aspect ratio
+    """
+
+    name, ext = os.path.splitext(filename)
+    output_file = os.path.join(ICONS_DIR, f"{name}-{width}{ext}")
+
+    with Image.open(os.path.join(ICONS_DIR, filename)) as image:
+        height = int(image.height * width / image.width)
+        image.resize((width, height), Image.Resampling.LANCZOS).save(output_file, optimize=True)
+
+    print(f"[+] Wrote {output_file} ({width}x{height})")
+
+
+def generate_icons():
+    """
+    Generate pre-sized icons
+    """
+
+    print("[*] Generating pre-sized icons...")
+    for filename, widths in ICON_SIZES.items():
+        for width in widths:
+            resize_icon(filename, width)
+    print("[✓] Done.")
+
+
+if __name__ == "__main__":
+    generate_icons()
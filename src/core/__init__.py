@@ -11,7 +11,9 @@ License: MIT
 """
 
 # Standard library imports
-import uuid
+import asyncio
+import secrets
+import signal
 import sys
 from typing import TYPE_CHECKING
 
@@ -22,9 +24,9 @@ from tornado.httpserver import HTTPServer
 
 # Local application imports
 from core.server.http.http_handler import HttpAuthHandler, HttpWorkerHandler, \
-    HttpSystemHandler, HttpNetworkHandler, HttpWebUIHandler
+    HttpBootstrapHandler, HttpSystemHandler, HttpNetworkHandler, HttpWebUIHandler
 from core.server.websocket.websocket_handler import WebsocketHandler
-from core.thread_pool import executor
+from core.thread_pool import shutdown_executor
 
 # Type checking
 if TYPE_CHECKING:
@@ -43,10 +45,27 @@ def signal_handler(_sig, _frame):
 
     print("Shutting down gracefully...")
     IOLoop.current().stop()
-    executor.shutdown(wait=True)
+    shutdown_executor(wait=True)
     sys.exit(0)
 
 
+def setup_runtime():
+    """
+    Prepares the process-wide runtime shared by the GUI and headless entry points.
+
+    Selects the selector event loop policy on Windows and installs the signal
+    handlers for graceful shutdown.
+    """
+
+    # Tornado runs natively on the selector event loop, the default proactor
+    # event loop requires an extra selector thread for each IOLoop on Windows
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+
 def create_server(
         db: "PSMonitorDatabaseManager",
         logger: "PSMonitorLogger",
@@ -59,7 +78,7 @@ def create_server(
     return HTTPServer(create_app({
         "template_path": view_path,
         "static_path": view_path,
-        "cookie_secret": uuid.uuid1().hex,
+        "cookie_secret": secrets.token_hex(32),
         "xsrf_cookies": False,
         "debug": False,
         "db": db,
@@ -94,6 +113,7 @@ def create_app(settings: dict) -> Application | bool:
         (r"/", HttpWebUIHandler),
         (r"/authenticate", HttpAuthHandler),
         (r"/worker", HttpWorkerHandler),
+        (r"/bootstrap", HttpBootstrapHandler),
         (r"/system", HttpSystemHandler),
         (r"/network", HttpNetworkHandler),
         (r"/connect", WebsocketHandler),
@@ -15,6 +15,7 @@ import os
 import sys
 import json
 import secrets
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 # Typing (type hints only, no runtime dependency)
@@ -25,7 +26,7 @@ if TYPE_CHECKING:
 APP_NAME = "PSMonitor"
 
 # Default server address and port
-DEFAULT_ADDRESS = "localhost"
+DEFAULT_ADDRESS = "127.0.0.1"
 DEFAULT_PORT = 4500
 
 # Default max allowed websocket connections
@@ -35,8 +36,9 @@ DEFAULT_MAX_WS_CONNECTIONS = 20
 DEFAULT_MAX_RECONNECT_ATTEMPTS = 3
 DEFAULT_RECONNECT_BASE_DELAY = 0.5
 
-# Default GUI widget update interval
+# Default GUI widget update interval, and the minimum allowed (at most 4 updates per second)
 DEFAULT_GUI_REFRESH_INTERVAL = 1000
+MIN_GUI_REFRESH_INTERVAL = 250
 
 # Default logging level and enabled state
 DEFAULT_LOG_LEVEL = "INFO"
@@ -75,15 +77,29 @@ default_settings = {
 }
 
 
-init_data = {
-    "cpu": {"usage": 0.0, "temp": 0, "freq": 0},
-    "mem": {"total": 0, "used": 0, "free": 0, "percent": 0},
-    "disk": {"total": 0, "used": 0, "free": 0, "percent": 0},
+# Read-only template for the GUI's initial data, copy before mutating
+INIT_DATA = MappingProxyType({
+    "cpu": MappingProxyType({"usage": 0.0, "temp": 0, "freq": 0}),
+    "mem": MappingProxyType({"total": 0, "used": 0, "free": 0, "percent": 0}),
+    "disk": MappingProxyType({"total": 0, "used": 0, "free": 0, "percent": 0}),
     "user": "",
-    "platform": {"distro": "", "kernel": "", "uptime": ""},
+    "platform": MappingProxyType({"distro": "", "kernel": "", "uptime": ""}),
     "uptime": "",
-    "processes": []
-}
+    "processes": ()
+})
+
+
+def copy_init_data() -> dict:
+    """
+    Returns a mutable copy of the initial data template.
+    """
+
+    return {
+        key: dict(value) if isinstance(value, MappingProxyType)
+            else list(value) if isinstance(value, tuple)
+            else value
+        for key, value in INIT_DATA.items()
+    }
 
 # Launch mode
 _launch_mode = None
@@ -138,11 +154,11 @@ def read_settings_file(logger: "PSMonitorLogger" = None) -> dict:
             # Return default created settings
             return default_settings
 
-        # Read settings file and return settings
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
-    except (PermissionError, IsADirectoryError, json.JSONDecodeError) as e:
+        # Read settings file and return settings, json.loads accepts raw
+        # UTF-8 bytes so the text IO layer is skipped.
+        with open(SETTINGS_FILE, "rb") as f:
+            return json.loads(f.read())
+    except (PermissionError, IsADirectoryError, UnicodeDecodeError, json.JSONDecodeError) as e:
         if logger:
             logger.error("Failed to load or create settings file: %s", e)
         return default_settings
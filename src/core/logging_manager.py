@@ -17,11 +17,19 @@ import os
 import queue
 import subprocess
 import sys
+import threading
 
 # Local application imports
 import core.config as cfg
 
 
+# Constants
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 0.5
+
+
 class PSMonitorLogger:
     """
     Concurrent logger.
@@ -34,6 +42,8 @@ class PSMonitorLogger:
         - A single `queue.Queue` receives all log records via `QueueHandler`.
         - A dedicated background thread (`QueueListener`) consumes records from the 
         queue and dispatches them to attached handlers (e.g., file and console).
+        - File records are buffered by a `MemoryHandler` and written in batches,
+        either when the buffer fills, on a periodic flush, or immediately on errors.
     """
 
     def __init__(self, filename: str):
@@ -51,7 +61,12 @@ class PSMonitorLogger:
         os.makedirs(self._filepath, exist_ok=True)
         self._fullpath = os.path.join(self._filepath, filename)
 
-        self._file_handler = logging.FileHandler(self._fullpath, encoding="utf-8")
+        self._file_handler = logging.handlers.RotatingFileHandler(
+            self._fullpath,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding="utf-8"
+        )
         self._file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter(
             "[%(asctime)s] - %(levelname)s - %(message)s",
@@ -59,6 +74,14 @@ class PSMonitorLogger:
         )
         self._file_handler.setFormatter(formatter)
 
+        # Buffer file records, errors are written immediately
+        self._memory_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=self._file_handler
+        )
+        self._memory_handler.setLevel(logging.INFO)
+
         # Create console handler
         self._console_handler = logging.StreamHandler()
         self._console_handler.setLevel(logging.INFO)
@@ -74,13 +97,22 @@ class PSMonitorLogger:
         # Setup QueueListener to pull logs from queue and output to handlers
         self._listener = logging.handlers.QueueListener(
             self._log_queue,
-            self._file_handler,
+            self._memory_handler,
             self._console_handler,
             respect_handler_level=True
         )
 
         self._listener.start()
 
+        # Periodically flush buffered records to the log file
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(
+            target=self._flush_periodically,
+            name="PSMonitorLogFlushThread",
+            daemon=True
+        )
+        self._flush_thread.start()
+
         self.load_settings()
 
 
@@ -100,6 +132,7 @@ class PSMonitorLogger:
         log_level = level_map.get(level.upper())
         if log_level is not None:
             self._logger.setLevel(log_level)
+            self._memory_handler.setLevel(log_level)
             self._file_handler.setLevel(log_level)
             self._console_handler.setLevel(log_level)
             self._logger.debug("Log level is set to %s", level.upper())
@@ -113,6 +146,22 @@ class PSMonitorLogger:
         return self._enabled
 
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check if a message of the given level would be logged.
+
+        Use this to skip building expensive messages that would be discarded.
+
+        Args:
+            level (int): The logging level, e.g. `logging.DEBUG`.
+
+        Returns:
+            bool: True if logging is enabled for the level.
+        """
+
+        return self._enabled and self._logger.isEnabledFor(level)
+
+
     def set_enabled(self, enabled: bool) -> None:
         """
         Set logging enabled status.
@@ -121,48 +170,77 @@ class PSMonitorLogger:
         self._enabled = enabled
 
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """
         Write an info message to the log if logging is enabled.
+
+        Any args are merged into the message with %-formatting, which is deferred
+        until the record is handled.
         """
 
         if not self._enabled:
             return
 
-        self._logger.info(message)
+        self._logger.info(message, *args)
 
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """
         Write a warning message to the log if logging is enabled.
+
+        Any args are merged into the message with %-formatting, which is deferred
+        until the record is handled.
         """
 
         if not self._enabled:
             return
 
-        self._logger.warning(message)
+        self._logger.warning(message, *args)
 
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """
         Write an error message to the log if logging is enabled.
+
+        Any args are merged into the message with %-formatting, which is deferred
+        until the record is handled.
         """
 
         if not self._enabled:
             return
 
-        self._logger.error(message)
+        self._logger.error(message, *args)
 
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """
         Write an debug message to the log if logging is enabled.
+
+        Any args are merged into the message with %-formatting, which is deferred
+        until the record is handled.
         """
 
         if not self._enabled:
             return
 
-        self._logger.debug(message)
+        self._logger.debug(message, *args)
+
+
+    def flush(self) -> None:
+        """
+        Write any buffered records to the log file.
+        """
+
+        self._memory_handler.flush()
+
+
+    def _flush_periodically(self) -> None:
+        """
+        Flush buffered records at a fixed interval until the logger is stopped.
+        """
+
+        while not self._flush_stop.wait(LOG_FLUSH_INTERVAL):
+            self.flush()
 
 
     def open_log(self) -> None:
@@ -170,6 +248,8 @@ class PSMonitorLogger:
         View the app log
         """
 
+        self.flush()
+
         if not os.path.exists(self._fullpath):
             self._logger.warning("Log file not found at %s", self._fullpath)
             return
@@ -188,6 +268,9 @@ class PSMonitorLogger:
         Clear the app log.
         """
 
+        # Write out buffered records first so they are cleared too
+        self.flush()
+
         try:
             # Truncate the log file to zero length, effectively clearing it
             with open(self._fullpath, "w", encoding="utf-8"):
@@ -213,4 +296,7 @@ class PSMonitorLogger:
         Call this on app shutdown.
         """
 
+        self._flush_stop.set()
         self._listener.stop()
+        self._memory_handler.flush()
+        self._file_handler.close()
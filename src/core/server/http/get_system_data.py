@@ -30,15 +30,17 @@ def get_system_data() -> dict:
             - "processes": List of top 10 processes by memory usage.
     """
 
+    snapshot = psm.get_snapshot()
+
     return {
-        "cpu": psm.get_cpu(),
-        "mem": psm.get_memory(),
-        "disk": psm.get_disk(),
+        "cpu": snapshot["cpu"],
+        "mem": snapshot["mem"],
+        "disk": snapshot["disk"],
         "user": psm.get_user(),
         "platform": {
             "distro": psm.get_distro(),
             "kernel": psm.get_kernel(),
-            "uptime": psm.get_uptime()
+            "uptime": snapshot["uptime"]
         },
         "processes": psm.get_processes()
     }
@@ -69,12 +69,13 @@ class HttpWorkerHandler(BaseHandler):
         return worker
 
 
-    @jwt_required
-    async def post(self):
+    def register_worker(self) -> dict:
         """
-        Handles POST requests. Attempts to establish a connection and returns the
-        worker ID for pairing the websocket connection, websocket connect URL,
-        and message.
+        Creates a worker, adds it to the worker registry and constructs the URL for the
+        paired websocket connection.
+
+        Returns:
+            dict: The worker ID, websocket connect URL, and message.
         """
 
         worker_id = None
@@ -95,10 +96,42 @@ class HttpWorkerHandler(BaseHandler):
             connect_url = f"ws://{self.request.host}/connect?id={worker_id}&subscriber={subscriber}"
             message = "Websocket connection ready (Worker expires in 5 seconds if unclaimed)."
 
-        self.write({
+        return {
             "id": worker_id,
             "url": connect_url,
             "message": message
+        }
+
+
+    @jwt_required
+    async def post(self):
+        """
+        Handles POST requests. Attempts to establish a connection and returns the
+        worker ID for pairing the websocket connection, websocket connect URL,
+        and message.
+        """
+
+        self.write(self.register_worker())
+
+
+class HttpBootstrapHandler(HttpWorkerHandler):
+    """
+    HttpBootstrapHandler class for bootstrapping clients in a single round-trip. This
+    handler processes requests via HTTP POST and serves system data together with a
+    worker for pairing the websocket connection.
+    """
+
+    @jwt_required
+    async def post(self):
+        """
+        Handles POST requests. Returns the current system data along with the worker
+        ID, websocket connect URL, and message.
+        """
+
+        self.set_header("Content-Type", "application/json")
+        self.write({
+            "system": get_system_data(),
+            **self.register_worker()
         })
 
 
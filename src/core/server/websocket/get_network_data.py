@@ -14,7 +14,7 @@ License: MIT
 from tornado.ioloop import IOLoop
 
 # Local application imports
-from core.thread_pool import executor
+from core.thread_pool import get_executor
 from core.service.network_service import get_avg_in_out, get_interfaces, get_statistics
 
 
@@ -42,6 +42,7 @@ async def get_network_data(avg_in_out=False) -> dict:
     """
 
     loop = IOLoop.current()
+    executor = get_executor()
 
     futures = {
         "interfaces": loop.run_in_executor(executor, get_interfaces),
@@ -14,15 +14,16 @@ License: MIT
 from tornado.ioloop import IOLoop
 
 # Local application imports
-from core.thread_pool import executor
-from core.service.system_service import get_cpu, get_disk, get_memory, get_processes, get_uptime
+from core.thread_pool import get_executor
+from core.service.system_service import get_processes, get_snapshot
 
 
 async def get_system_data() -> dict:
     """
     Gathers system data including CPU, memory, disk usage, uptime, and processes.
 
-    The system data gathering tasks are offloaded to a worker thread in ThreadPoolExecutor,
+    The CPU, memory, disk and uptime statistics are collected together as one snapshot task,
+    and the process table as another, both offloaded to worker threads in ThreadPoolExecutor,
     yielding control back to the Tornado IOLoop.
 
     Returns:
@@ -36,17 +37,10 @@ async def get_system_data() -> dict:
 
     loop = IOLoop.current()
 
-    tasks = {
-        key: loop.run_in_executor(executor, fn)
-        for key, fn in {
-            "cpu": get_cpu,
-            "mem": get_memory,
-            "disk": get_disk,
-            "uptime": get_uptime,
-            "processes": get_processes,
-        }.items()
-    }
-
-    results = {key: await task for key, task in tasks.items()}
+    snapshot_task = loop.run_in_executor(get_executor(), get_snapshot)
+    processes_task = loop.run_in_executor(get_executor(), get_processes)
+
+    results = dict(await snapshot_task)
+    results["processes"] = await processes_task
 
     return results
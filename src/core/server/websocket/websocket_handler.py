@@ -14,6 +14,7 @@ License: MIT
 import weakref
 
 # Third-party imports
+import orjson
 from tornado.ioloop import IOLoop
 from tornado.iostream import StreamClosedError
 from tornado.httputil import HTTPServerRequest
@@ -39,6 +40,7 @@ class WebsocketHandler(WebSocketHandler):
         loop (IOLoop): The current IOLoop instance.
         worker_ref (weakref.ref): A weak reference to the worker associated
             with this WebSocket connection.
+        binary (bool): Whether data is sent as binary frames rather than text frames.
     
     Methods:
         data_received(chunk: bytes): Receives data chunks (no operation in this handler).
@@ -46,6 +48,7 @@ class WebsocketHandler(WebSocketHandler):
         open(): Handles the opening of a WebSocket connection.
         monitor_system(): Coroutine that continuously sends system data to the client.
         monitor_network(): Coroutine that continuously sends network data to the client.
+        write_data(data: dict): Sends JSON encoded data to the client.
         on_message(message: str): Handles incoming messages from the WebSocket client.
         on_close(): Cleans up and closes the associated worker when the connection closes.
     """
@@ -63,6 +66,7 @@ class WebsocketHandler(WebSocketHandler):
 
         self.loop = IOLoop.current()
         self.worker_ref = None
+        self.binary = False
 
         self.max_connections = cfg.get_setting(
             key="max_ws_connections",
@@ -113,6 +117,9 @@ class WebsocketHandler(WebSocketHandler):
 
         self.set_nodelay(True)
 
+        # Clients may opt in to binary frames to skip decoding text frames
+        self.binary = self.get_argument("binary", "0") == "1"
+
         # Bind the worker to this websocket session
         worker.set_handler(self)
 
@@ -135,7 +142,7 @@ class WebsocketHandler(WebSocketHandler):
             while True:
                 data = await get_system_data()
                 if data:
-                    await self.write_message(data)
+                    await self.write_data(data)
         except (StreamClosedError, WebSocketClosedError):
             pass
         finally:
@@ -153,13 +160,29 @@ class WebsocketHandler(WebSocketHandler):
             while True:
                 data = await get_network_data()
                 if data:
-                    await self.write_message(data)
+                    await self.write_data(data)
         except (StreamClosedError, WebSocketClosedError):
             pass
         finally:
             self.close()
 
 
+    def write_data(self, data: dict):
+        """
+        Sends JSON encoded data to the WebSocket client.
+
+        Data is sent as a text frame, or as a binary frame if the client opted in.
+
+        Args:
+            data (dict): The data to send.
+
+        Returns:
+            Future: Resolves when the message has been written.
+        """
+
+        return self.write_message(orjson.dumps(data), binary=self.binary)
+
+
     def data_received(self, chunk: bytes) -> None:
         """
         For this base handler, we do not process streaming request body.
@@ -11,8 +11,10 @@ License: MIT
 """
 
 # Standard library imports
+import logging
 import os
 import queue
+import socket
 import threading
 from typing import TYPE_CHECKING
 
@@ -45,6 +47,9 @@ class PSMonitorServerManager:
         self.port = cfg.DEFAULT_PORT
         self.address = cfg.DEFAULT_ADDRESS
 
+        # Set when attached to a server that was already running, e.g. headless
+        self.external = False
+
         self.load_settings()
 
         self._thread = None
@@ -67,6 +72,7 @@ class PSMonitorServerManager:
         """
 
         self._ioloop = IOLoop()
+        thread = threading.current_thread()
 
         base_dir = os.path.dirname(os.path.dirname(__file__))
         view_path = os.path.join(base_dir, 'gui', 'web')
@@ -76,10 +82,10 @@ class PSMonitorServerManager:
         queue_.put(self._server)
 
         def on_start():
-            self._logger.debug(
-                f"Tornado server thread started: {threading.current_thread().name} "
-                f"(ID: {threading.get_ident()})"
-            )
+            if self._logger.is_enabled_for(logging.DEBUG):
+                self._logger.debug(
+                    f"Tornado server thread started: {thread.name} (ID: {thread.ident})"
+                )
             self._logger.info(f"Tornado server listening on http://{self.address}:{port}")
             started_event.set()
 
@@ -108,6 +114,7 @@ class PSMonitorServerManager:
         with self._lock:
             if self._thread and self._thread.is_alive():
                 raise RuntimeError("Server already running")
+            self.external = False
             self._server_queue = queue.Queue()
             self._started_event = threading.Event()
 
@@ -127,6 +134,24 @@ class PSMonitorServerManager:
             self._server = self._server_queue.get()
 
 
+    def is_serving(self, timeout: float = 0.2) -> bool:
+        """
+        Check if a server is already listening on the configured address and port.
+
+        Args:
+            timeout (float): Seconds to wait for the connection.
+
+        Returns:
+            bool: True if the port accepted a connection.
+        """
+
+        try:
+            with socket.create_connection((self.address, self.port), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
+
     def stop(self):
         """
         Stops the Tornado server and waits for thread to finish.
@@ -156,10 +181,19 @@ class PSMonitorServerManager:
         """
         Restarts the server with new parameters.
 
+        An external server is not owned by the manager, so it is left running
+        and only replaced by a local server if it is no longer serving the port.
+
         Args:
             port (int): Port to listen on.
         """
 
+        if self.external and port == self.port and self.is_serving():
+            self._logger.info(
+                f"External server is still serving on http://{self.address}:{self.port}"
+            )
+            return
+
         self.stop()
         self.start(port)
 
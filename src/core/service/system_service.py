@@ -16,6 +16,7 @@ import platform
 import sys
 import subprocess
 import functools
+import time
 from collections import defaultdict
 
 # Third-party imports
@@ -28,9 +29,24 @@ from core.config import BUNDLE_DIR
 if sys.platform == "win32":
     import ctypes
     import getpass
+    import winreg # pylint: disable=import-error
 elif sys.platform == "linux":
     import pwd # pylint: disable=import-error
 
+# Uptime reading cache, sub-second precision is not displayed
+UPTIME_CACHE_TTL = 1.0
+_uptime_cache = {"ts": float("-inf"), "value": None}
+
+# (singular, plural) unit names for the formatted uptime string
+_UPTIME_UNITS = (("day", "days"), ("hr", "hrs"), ("min", "mins"), ("sec", "secs"))
+
+# Bytes to gigabytes multiplier
+_INV_GB = 1.0 / (1024.0 ** 3)
+
+# Fused system snapshot cache, shared by every polling client
+SNAPSHOT_CACHE_TTL = 0.5
+_snapshot_cache = {"ts": float("-inf"), "value": None}
+
 
 def convert_bytes(x: int, pre: int = 2) -> float:
     """
@@ -44,7 +60,7 @@ def convert_bytes(x: int, pre: int = 2) -> float:
         float: The size in gigabytes, rounded to the specified precision.
     """
 
-    return round(x / (1024.0 ** 3), pre)
+    return round(x * _INV_GB, pre)
 
 
 def get_cpu() -> dict:
@@ -95,9 +111,9 @@ def get_disk() -> dict:
     disk_data = psutil.disk_usage("/")
 
     return {
-        "total": convert_bytes(disk_data.total),
-        "used": convert_bytes(disk_data.used),
-        "free": convert_bytes(disk_data.free),
+        "total": round(disk_data.total * _INV_GB, 2),
+        "used": round(disk_data.used * _INV_GB, 2),
+        "free": round(disk_data.free * _INV_GB, 2),
         "percent": disk_data.percent,
     }
 
@@ -119,9 +135,9 @@ def get_memory() -> dict:
     memory_data = psutil.virtual_memory()
 
     return {
-        "total": convert_bytes(memory_data.total),
-        "used": convert_bytes(memory_data.used),
-        "free": convert_bytes(memory_data.free),
+        "total": round(memory_data.total * _INV_GB, 2),
+        "used": round(memory_data.used * _INV_GB, 2),
+        "free": round(memory_data.free * _INV_GB, 2),
         "percent": memory_data.percent,
     }
 
@@ -167,48 +183,124 @@ def get_processes() -> list:
     return sorted(combined_list, key=lambda x: x["mem"], reverse=True)[:10]
 
 
-def get_uptime() -> str:
+def _read_uptime_seconds() -> float | None:
     """
-    Retrieves system uptime.
+    Reads the raw system uptime in seconds.
 
-    This function reads the system uptime from the "/proc/uptime" file and formats
-    it into a human-readable string.
+    On Linux, "/proc/uptime" is read with a single unbuffered `os.read` rather than
+    through the text IO stack. The reading is cached for `UPTIME_CACHE_TTL` seconds
+    as sub-second precision is not shown in the formatted output.
 
     Returns:
-        str: A string representing the system uptime in days, hours, minutes, and seconds.
-            If the file cannot be read, returns an error message.
+        float | None: The uptime in seconds, or None if it cannot be determined.
     """
 
+    now = time.monotonic()
+    if now - _uptime_cache["ts"] < UPTIME_CACHE_TTL:
+        return _uptime_cache["value"]
+
     if sys.platform == "win32":
         try:
-            uptime_ms = ctypes.windll.kernel32.GetTickCount64()
-            total_seconds = uptime_ms / 1000.0
+            total_seconds = ctypes.windll.kernel32.GetTickCount64() / 1000.0
         except AttributeError:
-            return "N/A"  # GetTickCount64 not available
+            return None  # GetTickCount64 not available
         except OSError:
-            return "N/A"  # Problem calling kernel32
+            return None  # Problem calling kernel32
     else:
         try:
-            with open("/proc/uptime", "r", encoding="utf-8") as f:
-                total_seconds = float(f.read().split()[0])
-        except (FileNotFoundError, PermissionError, ValueError, OSError):
-            return "N/A"
+            fd = os.open("/proc/uptime", os.O_RDONLY)
+            try:
+                buf = os.read(fd, 64)
+            finally:
+                os.close(fd)
+            total_seconds = float(buf[:buf.index(b" ")])
+        except (OSError, ValueError):
+            return None
+
+    _uptime_cache["ts"] = now
+    _uptime_cache["value"] = total_seconds
+
+    return total_seconds
 
-    days, remainder = divmod(total_seconds, 86400)
-    hours, remainder = divmod(remainder, 3600)
-    minutes, seconds = divmod(remainder, 60)
 
-    uptime_parts = [
-        f"{int(days)} day{'s' if days != 1 else ''}" if days else "",
-        f"{int(hours)} hr{'s' if hours != 1 else ''}" if hours else "",
-        f"{int(minutes)} min{'s' if minutes != 1 else ''}" if minutes else "",
-        f"{int(seconds)} sec{'s' if seconds != 1 else ''}" if seconds else ""
-    ]
+def get_uptime() -> str:
+    """
+    Retrieves system uptime.
 
-    return ", ".join(part for part in uptime_parts if part)
+    This function reads the system uptime from the "/proc/uptime" file and formats
+    it into a human-readable string.
 
+    Returns:
+        str: A string representing the system uptime in days, hours, minutes, and seconds.
+            If the file cannot be read, returns an error message.
+    """
+
+    total_seconds = _read_uptime_seconds()
+    if total_seconds is None:
+        return "N/A"
 
-@functools.lru_cache(maxsize=1024)
+    return format_uptime(int(total_seconds))
+
+
+@functools.lru_cache(maxsize=256)
+def format_uptime(total_seconds: int) -> str:
+    """
+    Formats a whole number of seconds into a human-readable uptime string.
+
+    Results are memoized, so repeated polls within the same second are a cache hit.
+
+    Args:
+        total_seconds (int): The uptime in whole seconds.
+
+    Returns:
+        str: A string representing the uptime in days, hours, minutes, and seconds.
+    """
+
+    minutes, seconds = divmod(total_seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    return ", ".join(
+        f"{n} {unit[n != 1]}"
+        for n, unit in zip((days, hours, minutes, seconds), _UPTIME_UNITS)
+        if n
+    )
+
+
+def get_snapshot() -> dict:
+    """
+    Retrieves CPU, memory, disk and uptime statistics in a single pass.
+
+    Collecting the metrics together lets callers submit one task to the executor
+    instead of one per metric. The snapshot is cached for `SNAPSHOT_CACHE_TTL`
+    seconds, so concurrent clients polling in a tight loop share the same reads.
+
+    Returns:
+        dict: A dictionary containing the following keys:
+            - "cpu": CPU usage, temperature, and frequency.
+            - "mem": Memory usage statistics.
+            - "disk": Disk usage statistics.
+            - "uptime": System uptime.
+    """
+
+    now = time.monotonic()
+    if now - _snapshot_cache["ts"] < SNAPSHOT_CACHE_TTL:
+        return _snapshot_cache["value"]
+
+    snapshot = {
+        "cpu": get_cpu(),
+        "mem": get_memory(),
+        "disk": get_disk(),
+        "uptime": get_uptime(),
+    }
+
+    _snapshot_cache["ts"] = now
+    _snapshot_cache["value"] = snapshot
+
+    return snapshot
+
+
+@functools.cache
 def get_user() -> str:
     """
     Retrieves the username of the current user.
@@ -228,37 +320,42 @@ def get_user() -> str:
     return pwd.getpwuid(os.getuid())[0] # pylint: disable=used-before-assignment,no-member
 
 
-@functools.lru_cache(maxsize=1024)
+@functools.cache
 def get_distro() -> str:
     """
     Retrieves the name of the operating system distribution.
 
-    On Windows, it uses the `wmic` command to get the OS caption.
-    On Unix-like systems, it reads the `/etc/*-release` file to get the distribution name.
+    On Windows, it reads the product name from the registry.
+    On Unix-like systems, it reads the os-release file to get the distribution name.
 
     Returns:
         str: The name of the operating system distribution.
     """
 
     if sys.platform == "win32":
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        try:
+            with winreg.OpenKey(
+                winreg.HKEY_LOCAL_MACHINE,
+                r"SOFTWARE\Microsoft\Windows NT\CurrentVersion"
+            ) as key:
+                product_name = winreg.QueryValueEx(key, "ProductName")[0]
+                build = int(winreg.QueryValueEx(key, "CurrentBuildNumber")[0])
+        except (OSError, ValueError):
+            return "Unknown OS"
 
-        result = subprocess.check_output(
-            ["wmic", "os", "get", "Caption"],
-            text=True,
-            startupinfo=startupinfo
-        )
-        os_name = result.strip().split("\n")
+        # Windows 11 still reports itself as Windows 10 in ProductName
+        if build >= 22000:
+            product_name = product_name.replace("Windows 10", "Windows 11")
 
-        return os_name[2].strip() if len(os_name) > 1 else "Unknown OS"
+        return f"Microsoft {product_name}"
 
-    return os.popen(
-        'cat /etc/*-release | grep "^PRETTY_NAME=" | cut -d= -f2'
-    ).read().replace('"', '').strip()
+    try:
+        return platform.freedesktop_os_release().get("PRETTY_NAME", "")
+    except OSError:
+        return ""
 
 
-@functools.lru_cache(maxsize=1024)
+@functools.cache
 def get_kernel() -> str:
     """
     Retrieves the kernel version of the operating system.
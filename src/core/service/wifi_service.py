@@ -13,24 +13,43 @@ License: MIT
 # Standard library imports
 import re
 import sys
+import time
+import functools
 import subprocess
 from typing import Optional
 
+# Wi-Fi data cache, shelling out is slow and wireless state changes slowly
+WIFI_CACHE_TTL = 5.0
+_wifi_cache = {"ts": float("-inf"), "value": None}
+
+# Ping, download and upload values from speedtest-cli --simple output
+_SPEEDTEST_RE = re.compile(r"Ping:\s(\S+).*?Download:\s(\S+).*?Upload:\s(\S+)", re.S)
+
 
 def get_wifi_data() -> dict:
     """
     Parses Wi-Fi information depending on the platform.
 
+    Spawning netsh or iwlist is slow and wireless state changes slowly, so the
+    result is cached for `WIFI_CACHE_TTL` seconds.
+
     Returns:
         dict: A dictionary containing parsed Wi-Fi information.
     """
 
+    now = time.monotonic()
+    if now - _wifi_cache["ts"] < WIFI_CACHE_TTL:
+        return _wifi_cache["value"]
+
     output = {}
     if sys.platform == "win32":
         output = get_wifi_data_windows()
     elif sys.platform == "linux":
         output = get_wifi_data_linux()
 
+    _wifi_cache["ts"] = now
+    _wifi_cache["value"] = output
+
     return output
 
 
@@ -66,16 +85,19 @@ def get_wifi_data_windows() -> Optional[dict]:
             "quality": re.compile(r"^\s*Signal\s*:\s*(\d+)%$"),
             "channel": re.compile(r"^\s*Channel\s*:\s*(\d+)$"),
             "encryption": re.compile(r"^\s*Authentication\s*:\s*(.+)$"),
-            "address": re.compile(r"^\s*(?:AP\s+)?BSSID\s*:\s*(.+)$"),
-            "signal": re.compile(r"^\s*Signal\s*:\s*(\d+)%$")
+            "address": re.compile(r"^\s*(?:AP\s+)?BSSID\s*:\s*(.+)$")
         }
 
         for line in result.split("\n"):
+            line = line.strip()
             for key, pattern in patterns.items():
-                match_obj = pattern.match(line.strip())
+                match_obj = pattern.match(line)
                 if match_obj:
                     output[key] = match_obj.groups()[0].strip()
 
+        # netsh only reports a signal percentage, which is used for both fields
+        output["signal"] = output["quality"]
+
         return output
 
     except (subprocess.CalledProcessError, ValueError):
@@ -126,26 +148,27 @@ def get_wifi_data_linux() -> dict:
     return output
 
 
+@functools.lru_cache(maxsize=1)
 def get_wifi_interface() -> str:
     """
-    Gets the wi-fi interface using the iw command.
+    Gets the wi-fi interface from /proc/net/wireless.
+
+    The interface is resolved once and memoized for the session.
 
     Returns:
         str: the name of the wi-fi interface.
     """
 
-    proc = subprocess.Popen(
-        ["iw", "dev"],
-        stdout=subprocess.PIPE,
-        universal_newlines=True
-    )
-    out, _ = proc.communicate()
-
     interface = "wlan0"
-    for line in out.split("\n"):
-        addr = match(line, "Interface ")
-        if addr is not None:
-            interface = addr
+    try:
+        with open("/proc/net/wireless", "r", encoding="utf-8") as f:
+            # The first two lines are column headers
+            for line in f.readlines()[2:]:
+                name, sep, _ = line.partition(":")
+                if sep:
+                    interface = name.strip()
+    except OSError:
+        pass
 
     return interface
 
@@ -164,21 +187,15 @@ def run_wifi_speedtest() -> dict:
         stdout=subprocess.PIPE
     ).stdout.read().decode("utf-8")
 
-    ping = re.findall(r"Ping:\s(.*?)\s", speedtest, re.MULTILINE)
-    download = re.findall(r"Download:\s(.*?)\s", speedtest, re.MULTILINE)
-    upload = re.findall(r"Upload:\s(.*?)\s", speedtest, re.MULTILINE)
+    result = _SPEEDTEST_RE.search(speedtest)
+    if result is None:
+        return {}
 
-    response = {}
-    try:
-        response.update({
-            "ping": ping[0].replace(",", "."),
-            "download": download[0].replace(",", "."),
-            "upload": upload[0].replace(",", ".")
-        })
-    except Exception:
-        pass
-
-    return response
+    return {
+        "ping": result[1].replace(",", "."),
+        "download": result[2].replace(",", "."),
+        "upload": result[3].replace(",", ".")
+    }
 
 
 def get_name(cell: list) -> str:
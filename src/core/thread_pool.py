@@ -11,13 +11,38 @@ License: MIT
 """
 
 # Standard library imports
+import os
+import functools
 from concurrent.futures import ThreadPoolExecutor
 
-# Third-party imports
-import psutil
-
 # Determine the number of available CPU cores
-num_cores = psutil.cpu_count(logical=True)
+num_cores = os.cpu_count() or 4
+
+# Maximum number of worker threads for parallel data gathering
+max_workers = min(num_cores * 2, 16)
+
+
+@functools.cache
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Gets the shared thread pool executor for parallel data gathering.
+
+    The executor is created on first use, so no threads are spawned at import time.
+
+    Returns:
+        ThreadPoolExecutor: The shared thread pool executor.
+    """
+
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="PSMonitorWorker")
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """
+    Shuts down the shared thread pool executor if it has been created.
+
+    Args:
+        wait (bool): Wait for pending tasks to complete before returning.
+    """
 
-# Create a thread pool executor for parallel data gathering
-executor = ThreadPoolExecutor(max_workers=min(num_cores * 2, 16))
+    if get_executor.cache_info().currsize:
+        get_executor().shutdown(wait=wait)
@@ -11,12 +11,11 @@ License: MIT
 """
 
 # Standard library imports
-import signal
 import sys
 
 # Local application imports
-from core import signal_handler
-from core.config import init_data, set_launch_mode
+from core import setup_runtime
+from core.config import copy_init_data, set_launch_mode
 from core.logging_manager import PSMonitorLogger
 from core.database_manager import PSMonitorDatabaseManager
 from core.server_manager import PSMonitorServerManager
@@ -24,8 +23,7 @@ from gui.app_manager import PSMonitorApp
 
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    setup_runtime()
 
     set_launch_mode("gui")
 
@@ -40,11 +38,19 @@ if __name__ == "__main__":
     # Create server manager to handle threaded server
     server_manager = PSMonitorServerManager(db, logger)
 
-    try:
-        server_manager.start()
-    except Exception as e:
-        logger.error(f"Failed to start server: {e}")
-        sys.exit(1)
-
-    app = PSMonitorApp(init_data, server_manager, logger)
+    # Attach to a server that is already running instead of starting another
+    if server_manager.is_serving():
+        server_manager.external = True
+        logger.info(
+            "Using server already listening on "
+            f"http://{server_manager.address}:{server_manager.port}"
+        )
+    else:
+        try:
+            server_manager.start()
+        except Exception as e:
+            logger.error(f"Failed to start server: {e}")
+            sys.exit(1)
+
+    app = PSMonitorApp(copy_init_data(), server_manager, logger)
     app.mainloop()
@@ -11,16 +11,19 @@ License: MIT
 """
 
 # Standard library imports
-import json
-import socket
-import sys
-import time
+import collections
+import logging
+import random
 import threading
 from typing import TYPE_CHECKING
 
 # Third-party imports
-import requests
-import websocket
+import orjson
+from tornado import gen
+from tornado.httpclient import AsyncHTTPClient, HTTPClientError
+from tornado.ioloop import IOLoop
+from tornado.tcpclient import TCPClient
+from tornado.websocket import websocket_connect
 
 # Local application imports
 from core.auth import get_credentials
@@ -30,6 +33,15 @@ if TYPE_CHECKING:
     from gui.app_manager import PSMonitorApp
 
 
+# Constants
+WS_CLOSE_TIMEOUT = 2.0
+MAX_RECONNECT_DELAY = 30.0
+
+# Connection failures reported to the GUI thread, see pop_failure()
+CONNECTION_ERROR = "connection_error"
+CONNECTION_EXHAUSTED = "connection_exhausted"
+
+
 class PSMonitorAppClient():
     """
     App client for connection to the tornado server.
@@ -44,23 +56,33 @@ class PSMonitorAppClient():
 
         self._manager = manager
 
-        self.port = self._manager.server.port
-        self.address = self._manager.server.address
-
-        self.http_url = f"http://{self.address}:{self.port}"
-        self.ws_url = f"ws://{self.address}:{self.port}/connect"
+        self.address = None
+        self.port = None
+        self.set_address_and_port(self._manager.server.address, self._manager.server.port)
 
         self._ws = None
+        self._ws_ioloop = None
         self._ws_client_thread = None
 
         self._auth_token = None
+        self._auth_headers = None
         self._user_id = None
         self._worker_id = None
 
+        # Handoff from the websocket client thread, which never calls into Tk.
+        # The initial data has its own slot so a websocket frame arriving before
+        # the next GUI refresh can't replace it, only the latest frame is kept.
+        self._pending_bootstrap = collections.deque(maxlen=1)
+        self._pending = collections.deque(maxlen=1)
+        self._failure = collections.deque(maxlen=1)
+
 
     def safe_connect(self, max_attempts: int = None, base_delay: float = None) -> None:
         """
-        Initialize the connection if the server is reachable.
+        Initialize the connection in the background once the server is reachable.
+
+        The connection is set up on the websocket client thread so the GUI is not
+        blocked while waiting for the server.
         """
 
         if max_attempts is None:
@@ -68,31 +90,21 @@ class PSMonitorAppClient():
         if base_delay is None:
             base_delay = self._manager.settings_handler.reconnect_base_delay.get()
 
-        attempt = 0
-        while attempt < max_attempts:
-            if self.check_server_reachable():
-
-                try:
-                    self._authenticate()
-                except Exception as e:
-                    self._manager.logger.error("Failed to authenticate user")
-                    raise PermissionError("Failed to authenticate user.") from e
+        if self._ws_client_thread and self._ws_client_thread.is_alive():
+            self.close_websocket_connection()
 
-                self._setup_connection()
-                return
+        self._failure.clear()
 
-            delay = base_delay * (2 ** attempt)
-            self._manager.logger.warning(
-                f"Server unreachable. Retrying in {delay:.1f} seconds... (attempt {attempt + 1})"
-            )
-            time.sleep(delay)
-            attempt += 1
-
-        self._manager.logger.error(
-            f"Failed to connect after {max_attempts} attempts. Shutting down."
+        # Run the client on its own IOLoop in another thread so it doesn't
+        # block the GUI's mainloop().
+        self._ws_client_thread = threading.Thread(
+            target=self._ws_client_thread_target,
+            args=(max_attempts, base_delay),
+            name="PSMonitorWSClientThread",
+            daemon=True
         )
-        self._manager.shutdown()
-        sys.exit(1)
+
+        self._ws_client_thread.start()
 
 
     def set_address_and_port(self, address: str, port: str) -> None:
@@ -100,103 +112,198 @@ class PSMonitorAppClient():
         Configure connection address and port.
         """
 
+        if address == self.address and port == self.port:
+            return
+
         self.address = address
         self.port = port
 
         self.http_url = f"http://{self.address}:{self.port}"
         self.ws_url = f"ws://{self.address}:{self.port}/connect"
+        self._addr = (self.address, int(self.port))
+
+        self._auth_url = f"{self.http_url}/authenticate"
+        self._bootstrap_url = f"{self.http_url}/bootstrap"
 
 
-    def _authenticate(self) -> None:
+    async def _authenticate(self) -> None:
         """
         Authenticate against the embedded server.
         """
 
         username, password = get_credentials()
 
-        response = requests.post(
-            f"{self.http_url}/authenticate",
-            json={"username": username, "password": password},
-            timeout=5
+        response = await AsyncHTTPClient().fetch(
+            self._auth_url,
+            method="POST",
+            headers={"Content-Type": "application/json"},
+            body=orjson.dumps({"username": username, "password": password}),
+            request_timeout=5
         )
 
-        data = response.json()
+        data = orjson.loads(response.body)
         self._auth_token = data.get("token")
+        self._auth_headers = {"Authorization": f"Bearer {self._auth_token}"}
         self._user_id = data.get("user_id")
         self._manager.logger.info("User has successfully authenticated")
 
 
-    def _setup_connection(self) -> None:
+    async def _setup_connection(self) -> str | None:
         """
         Initialize the connection.
+
+        Fetches the initial system data and a worker for the websocket connection
+        in a single request. The initial data is applied on the GUI's next refresh.
+
+        Returns:
+            str | None: The worker ID, or None if the request failed.
         """
 
         try:
-            response = requests.get(
-                url=f"{self.http_url}/system",
-                headers={"Authorization": f"Bearer {self._auth_token}"},
-                timeout=5
+            response = await AsyncHTTPClient().fetch(
+                self._bootstrap_url,
+                method="POST",
+                headers=self._auth_headers,
+                body=b"",
+                request_timeout=5
             )
-            self._manager.data.update(response.json())
-            self._manager.update_gui_sections()
-            self._start_websocket_connection()
-        except requests.RequestException as e:
+            bootstrap = orjson.loads(response.body)
+            self._pending_bootstrap.append(bootstrap["system"])
+
+            self._worker_id = bootstrap["id"]
+            if self._manager.logger.is_enabled_for(logging.DEBUG):
+                self._manager.logger.debug(f"Worker obtained: {self._worker_id}")
+
+            return self._worker_id
+        except (HTTPClientError, OSError, orjson.JSONDecodeError) as e:
             self._manager.logger.error(f"Error connecting to server: {e}")
 
+        return None
+
 
-    def _start_websocket_connection(self) -> None:
+    def _ws_client_thread_target(self, max_attempts: int, base_delay: float) -> None:
         """
-        Starts the websocket connection for live data updates.
+        The target function for the websocket client thread.
+
+        Args:
+            max_attempts (int): Maximum attempts to reach the server.
+            base_delay (float): Base delay in seconds for the retry backoff.
+        """
+
+        self._ws_ioloop = IOLoop()
+        thread = threading.current_thread()
+
+        if self._manager.logger.is_enabled_for(logging.DEBUG):
+            self._manager.logger.debug(
+                f"Websocket client thread started: {thread.name} (ID: {thread.ident})"
+            )
+
+        self._ws_ioloop.add_callback(self._run_client, max_attempts, base_delay)
+        self._ws_ioloop.start()
+        self._ws_ioloop.close()
+
+
+    async def _run_client(self, max_attempts: int, base_delay: float) -> None:
         """
+        Coroutine that connects to the server, retrying with exponential backoff,
+        then runs the websocket connection until it is closed.
+
+        Args:
+            max_attempts (int): Maximum attempts to reach the server.
+            base_delay (float): Base delay in seconds for the retry backoff.
+        """
+
+        self._ws = None
 
         try:
-            response = requests.post(
-                url=f"{self.http_url}/worker",
-                headers={"Authorization": f"Bearer {self._auth_token}"},
-                timeout=5
+            attempt = 0
+            while attempt < max_attempts:
+                if await self.check_server_reachable():
+                    try:
+                        await self._authenticate()
+                    except Exception:
+                        self._manager.logger.error("Failed to authenticate user")
+                        self._failure.append(CONNECTION_ERROR)
+                        return
+
+                    worker_id = await self._setup_connection()
+                    if worker_id is None:
+                        self._failure.append(CONNECTION_ERROR)
+                        return
+
+                    await self._run_websocket(
+                        f"{self.ws_url}?id={worker_id}&subscriber={self._user_id}&binary=1"
+                    )
+                    return
+
+                # Capped exponential backoff, with jitter to avoid retrying in lockstep
+                delay = min(base_delay * (2 ** attempt), MAX_RECONNECT_DELAY)
+                delay *= random.uniform(0.8, 1.2)
+                self._manager.logger.warning(
+                    f"Server unreachable. Retrying in {delay:.1f} seconds... "
+                    f"(attempt {attempt + 1})"
+                )
+                await gen.sleep(delay)
+                attempt += 1
+
+            self._manager.logger.error(
+                f"Failed to connect after {max_attempts} attempts. Shutting down."
             )
-            worker = response.json()
-            self._worker_id = worker["id"]
-            self._manager.logger.debug(f"Worker obtained: {self._worker_id}")
-            self._connect_websocket(self._worker_id)
-        except requests.RequestException as e:
-            self._manager.logger.error(f"Error obtaining worker for websocket connection: {e}")
+            self._failure.append(CONNECTION_EXHAUSTED)
+        finally:
+            self._ws_ioloop.stop()
 
 
-    def _connect_websocket(self, worker_id: str) -> None:
+    async def _run_websocket(self, url: str) -> None:
         """
-        Starts the websocket connection with the specified worker ID.
+        Coroutine that connects to the websocket and reads messages until it is closed.
 
         Args:
-            worker_id (str): The worker ID for the websocket connection.
+            url (str): The websocket URL to connect to.
         """
 
-        websocket.enableTrace(False)
+        try:
+            self._ws = await websocket_connect(url)
+        except Exception as e:
+            self.on_error(url, e)
+            return
 
-        self._ws = websocket.WebSocketApp(
-            f"{self.ws_url}?id={worker_id}&subscriber={self._user_id}",
-            on_message=self.on_message,
-            on_error=self.on_error,
-            on_close=self.on_close,
-            on_open=self.on_open
-        )
+        # Don't delay small frames (pongs, close) on the loopback connection
+        self._ws.protocol.set_nodelay(True)
 
-        # small helper to allow us to log inside the ws client thread
-        def run_ws_forever():
-            self._manager.logger.debug(
-                f"Websocket client thread started: {threading.current_thread().name} "
-                f"(ID: {threading.get_ident()})"
-            )
-            self._ws.run_forever()
+        self.on_open(url)
 
-        # Run the websocket client in the another thread so it doesn"t block the GUI"s mainloop().
-        self._ws_client_thread = threading.Thread(
-            target=run_ws_forever,
-            name="PSMonitorWSClientThread",
-            daemon=True
-        )
+        while True:
+            message = await self._ws.read_message()
+            if message is None:
+                break
+            self.on_message(message)
 
-        self._ws_client_thread.start()
+        self.on_close(self._ws.close_code, self._ws.close_reason)
+
+
+    def _close_websocket(self) -> None:
+        """
+        Closes the websocket from the websocket client thread.
+        """
+
+        if self._ws:
+            self._ws.close() # ends the read loop, which stops the IOLoop
+        else:
+            self._ws_ioloop.stop()
+
+
+    def _abort_websocket(self) -> None:
+        """
+        Forcibly closes the websocket stream and stops the websocket client IOLoop.
+
+        Used when the closing handshake does not complete, e.g. the server is gone.
+        """
+
+        if self._ws and self._ws.protocol and self._ws.protocol.stream:
+            self._ws.protocol.stream.close()
+
+        self._ws_ioloop.stop()
 
 
     def get_worker(self) -> str:
@@ -206,87 +313,139 @@ class PSMonitorAppClient():
         return self._worker_id
 
 
-    def check_server_reachable(self, timeout=1):
+    async def check_server_reachable(self, timeout=1):
         """
         Check the server is reachable.
+
+        Connects without blocking the websocket client IOLoop, so the client can
+        still be closed while a probe is pending.
         """
         try:
-            with socket.create_connection((self.address, self.port), timeout=timeout):
-                self._manager.logger.info("Tornado server is reachable")
-                return True
+            stream = await TCPClient().connect(*self._addr, timeout=timeout)
         except OSError as e:
-            self._manager.logger.error(f"Tornado server is not reachable: {e}")
+            # StreamClosedError wraps the underlying error, e.g. connection refused
+            error = getattr(e, "real_error", None) or e
+            self._manager.logger.error(f"Tornado server is not reachable: {error}")
             return False
 
+        stream.close()
+        self._manager.logger.debug("Tornado server is reachable")
+        return True
+
 
     def close_websocket_connection(self):
         """
         Close the websocket connection.
         """
 
-        if self._ws:
-            self._ws.close() # signal the websocket to close
+        if self._ws_ioloop:
+            # signal the websocket to close on its own thread
+            self._ws_ioloop.add_callback(self._close_websocket)
 
         if self._ws_client_thread:
-            self._ws_client_thread.join(timeout=5)
+            self._ws_client_thread.join(timeout=WS_CLOSE_TIMEOUT)
+
+            if self._ws_client_thread.is_alive():
+                # closing handshake is stuck, drop the connection instead
+                self._manager.logger.warning("Websocket did not close in time, aborting connection")
+                self._ws_ioloop.add_callback(self._abort_websocket)
+                self._ws_client_thread.join(timeout=WS_CLOSE_TIMEOUT)
+
             if self._ws_client_thread.is_alive():
-                self._manager.logger.error("Websocket client thread did not terminate gracefully")
+                self._manager.logger.error("Websocket client thread did not terminate, abandoning")
             else:
-                self._manager.logger.debug("Websocket server thread terminated gracefully")
+                self._manager.logger.debug("Websocket client thread terminated gracefully")
 
 
-    def on_message(self, ws: websocket.WebSocketApp, message: str) -> None:
+    def flush_pending(self) -> None:
         """
-        Handles incoming websocket messages.
+        Applies the initial data if it has arrived, then the latest websocket frame.
 
-        Args:
-            ws (websocket.WebSocketApp): The websocket instance.
-            message (str): The incoming message.
+        Only the latest websocket frame is decoded. Must be called from the GUI thread.
         """
 
         try:
-            if not ws or not message.startswith("{"):
-                return
+            self._manager.refresh_data(self._pending_bootstrap.pop())
+        except IndexError:
+            pass
 
-            self._manager.refresh_data(json.loads(message))
-        except json.JSONDecodeError as e:
-            self._manager.logger.error(f"Invalid JSON from websocket: {message[:100]}... ({e})")
-        except Exception as e:
-            self._manager.logger.error(f"Error fetching websocket data: {e}")
+        try:
+            data = self._pending.pop()
+        except IndexError:
+            return
+
+        try:
+            data = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            self._manager.logger.error("Invalid JSON from websocket: %r... (%s)", data[:100], e)
+            return
+
+        self._manager.refresh_data(data)
+
+
+    def pop_failure(self) -> str | None:
+        """
+        Returns the connection failure reported by the websocket client thread, if any.
+
+        Must be called from the GUI thread.
+
+        Returns:
+            str | None: CONNECTION_ERROR, CONNECTION_EXHAUSTED or None.
+        """
+
+        try:
+            return self._failure.pop()
+        except IndexError:
+            return None
+
+
+    def on_message(self, message: bytes | str) -> None:
+        """
+        Handles incoming websocket messages.
+
+        Data is received as binary frames, or as text frames from servers that don't
+        support them. Any other text frames are status messages. Frames are decoded
+        on the GUI thread when applied, see `flush_pending()`.
+
+        Args:
+            message (bytes | str): The incoming message.
+        """
+
+        if message[:1] in (b"{", "{"):
+            self._pending.append(message)
 
 
-    def on_error(self, ws: websocket.WebSocketApp, error) -> None:
+    def on_error(self, url: str, error: Exception) -> None:
         """
         Handles websocket errors.
 
         Args:
-            ws (websocket.WebSocketApp): The websocket instance.
+            url (str): The websocket URL.
             error (Exception): The error encountered.
         """
 
-        self._manager.logger.error(f"Websocket error: {error} ({ws.url})")
+        self._manager.logger.error(f"Websocket error: {error} ({url})")
 
 
-    def on_close(self, _ws: websocket.WebSocketApp, _status_code: int, _msg: str) -> None:
+    def on_close(self, _status_code: int | None, _msg: str | None) -> None:
         """
         Handles websocket closure.
 
         Args:
-            _ws (websocket.WebSocketApp): The websocket instance.
-            _status_code (int): The status code for the closure.
-            _msg (str): The closure message.
+            _status_code (int | None): The status code for the closure.
+            _msg (str | None): The closure message.
         """
 
-        self._manager.logger.info("Websocket connection is closed")
+        self._manager.logger.debug("Websocket connection is closed")
 
 
-    def on_open(self, ws: websocket.WebSocketApp) -> None:
+    def on_open(self, url: str) -> None:
         """
         Handles websocket opening.
 
         Args:
-            ws (websocket.WebSocketApp): The websocket instance.
+            url (str): The websocket URL.
         """
 
-        self._manager.logger.info("Websocket connection is open")
-        self._manager.logger.debug(f"Websocket URL: {ws.url}")
+        if self._manager.logger.is_enabled_for(logging.DEBUG):
+            self._manager.logger.debug(f"Websocket connection is open ({url})")
@@ -11,20 +11,17 @@ License: MIT
 """
 
 # Standard library imports
+from operator import itemgetter
 import os
 import sys
-import threading
 import tkinter as tk
 from tkinter import ttk
 import webbrowser
 from typing import TYPE_CHECKING
 
-# Third-party imports
-from PIL import Image, ImageTk
-from tornado.ioloop import IOLoop
-
 # Local application imports
-from gui.app_client import PSMonitorAppClient
+import core.config as cfg
+from gui.app_client import CONNECTION_ERROR, CONNECTION_EXHAUSTED, PSMonitorAppClient
 from gui.graph_handler import PSMonitorAppGraphHandler
 from gui.settings_handler import PSMonitorAppSettingsHandler
 
@@ -36,6 +33,14 @@ if TYPE_CHECKING:
 
 # Constants
 BASE_DIR = os.path.dirname(__file__)
+ICONS_DIR = os.path.join(BASE_DIR, "assets", "icons")
+
+# Icons are pre-sized at build time, see build_resources/generate_icons.py
+PLATFORM_ICONS = {
+    "linux": os.path.join(ICONS_DIR, "linux-18.png"),
+    "windows": os.path.join(ICONS_DIR, "windows-14.png"),
+}
+PLATFORM_KEY = "linux" if sys.platform.startswith("linux") else "windows"
 
 CONN_ERR_MSG = (
     "ERROR! Server connection has failed.\n\n"
@@ -43,6 +48,56 @@ CONN_ERR_MSG = (
     "Please also check the app log for more details."
 )
 
+LICENSE_TEXT = (
+    "MIT License\n\n"
+    "Copyright (c) 2025 Chris Rowles\n\n"
+    "Permission is hereby granted, free of charge, to any person obtaining a copy "
+    "of this software and associated documentation files (the \"Software\"), to deal "
+    "in the Software without restriction, including without limitation the rights "
+    "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell "
+    "copies of the Software, and to permit persons to whom the Software is "
+    "furnished to do so, subject to the following conditions:\n\n"
+    "The above copyright notice and this permission notice shall be included in all "
+    "copies or substantial portions of the Software.\n\n"
+    "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR "
+    "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, "
+    "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE "
+    "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER "
+    "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, "
+    "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE "
+    "SOFTWARE."
+)
+
+# Section name, grid position and (key, text, suffix, with icon) label specs
+SECTION_SPECS = (
+    ("platform", 0, 0, (
+        ("distro", "", "", True),
+        ("kernel", "Kernel:", "", False),
+        ("uptime", "Up:", "", False),
+    )),
+    ("disk", 0, 1, (
+        ("used", "Used:", "GB", False),
+        ("free", "Free:", "GB", False),
+        ("percent", "Usage:", "%", False),
+    )),
+    ("cpu", 1, 0, (
+        ("temp", "Temperature:", "°C", False),
+        ("freq", "Frequency:", "MHz", False),
+        ("usage", "Usage:", "%", False),
+    )),
+    ("mem", 1, 1, (
+        ("used", "Used:", "GB", False),
+        ("free", "Free:", "GB", False),
+        ("percent", "Usage:", "%", False),
+    )),
+)
+
+REFRESH_KEYS = ("cpu", "mem", "disk", "user", "processes")
+
+PROCESS_COLUMNS = ("pid", "name", "username", "mem")
+PROCESS_VALUES = itemgetter(*PROCESS_COLUMNS)
+EMPTY_PROCESS_ROW = ("", "", "", "")
+
 class PSMonitorApp(tk.Tk):
     """
     GUI application for system monitoring.
@@ -61,7 +116,9 @@ class PSMonitorApp(tk.Tk):
 
         self.server = server
 
-        self._lock = threading.Lock()
+        # Bumped on every refresh, widgets are only redrawn for a new version
+        self._data_version = 0
+        self._rendered_version = 0
 
         # Must be initiialized before others and in the following order
         self.data = data
@@ -94,41 +151,40 @@ class PSMonitorApp(tk.Tk):
             title="Memory Usage Graph"
         )
 
+        self._about_window = None
+
         self.processes_tree = None
+        self._tree_call = None
+        self._tree_path = None
         self.max_process_rows = 10
-        self.cached_processes = [("", "", "", "") for _ in range(self.max_process_rows)]
+        self._process_iids = ()
+        # Displayed process values, one list per column
+        self.cached_pids = [""] * self.max_process_rows
+        self.cached_names = [""] * self.max_process_rows
+        self.cached_usernames = [""] * self.max_process_rows
+        self.cached_mems = [""] * self.max_process_rows
 
         self.title("PSMonitor - System Monitoring")
         self.geometry("460x480")
         self.resizable(True, True)
         self.image_cache = {}
 
-        self.platform_icons = {}
-
-        platform_icon_defs = {
-            "linux":   ("linux.png", 18),
-            "windows": ("windows.png", 14),
-        }
+        # Only the current platform's icon is ever displayed
+        self.platform_icon = self.load_image(PLATFORM_ICONS[PLATFORM_KEY])
 
-        for platform, (filename, width) in platform_icon_defs.items():
-            path = os.path.join(BASE_DIR, "assets", "icons", filename)
-            self.platform_icons[platform] = self.load_image(path, width)
+        self._err_icon = self.load_image(path=os.path.join(ICONS_DIR, "error.png"))
 
-        self._err_icon = self.load_image(
-            path=os.path.join(BASE_DIR, "assets", "icons", "error.png"),
-            width=70
-        )
-
-        self.set_window_icon(os.path.join(BASE_DIR, "assets", "icons", "psmonitor.png"))
+        self.set_window_icon(os.path.join(ICONS_DIR, "psmonitor-32.png"))
         self.create_gui_menu()
         self.create_gui_sections(data)
 
-        try:
-            self.client.safe_connect()
-        except Exception:
-            self._open_error_window(CONN_ERR_MSG, actions={"restart_server": True})
+        # Start refreshing, and connect once the mainloop is running so the
+        # window is shown while the connection is set up in the background
+        self.after_idle(self.update_gui_sections)
+        self.after_idle(self.client.safe_connect)
 
         self.protocol("WM_DELETE_WINDOW", self.shutdown)
+        self.bind("<Map>", self._on_map)
 
 
     def set_window_icon(self, icon_path: str) -> str:
@@ -139,9 +195,7 @@ class PSMonitorApp(tk.Tk):
             icon_path (str): Path to the icon file.
         """
 
-        icon = Image.open(icon_path)
-        icon = icon.resize((32, 32))
-        icon_photo = ImageTk.PhotoImage(icon)
+        icon_photo = tk.PhotoImage(master=self, file=icon_path)
         self.iconphoto(True, icon_photo)
 
 
@@ -200,62 +254,29 @@ class PSMonitorApp(tk.Tk):
         main_frame = ttk.Frame(self)
         main_frame.pack(expand=True, fill="both", padx=5, pady=5)
 
-        def make_labels(frame, defs):
-            return {k: v(frame) for k, v in defs.items()}
-
-        sections = [
-            ("platform", 0, 0, {
-                "distro": lambda f: self.create_label_with_icon(f, data["platform"]["distro"]),
-                "kernel": lambda f: self.create_label(
-                    f, "Kernel:", data["platform"]["kernel"]
-                ),
-                "uptime": lambda f: self.create_label(
-                    f, "Up:", data["platform"]["uptime"]
-                ),
-            }),
-            ("disk", 0, 1, {
-                "used": lambda f: self.create_label(
-                    f, "Used:", f"{data['disk']['used']} GB", "GB"
-                ),
-                "free": lambda f: self.create_label(
-                    f, "Free:", f"{data['disk']['free']} GB", "GB"
-                ),
-                "percent": lambda f: self.create_label(
-                    f, "Usage:", f"{data['disk']['percent']} %", "%"
-                ),
-            }),
-            ("cpu", 1, 0, {
-                "temp": lambda f: self.create_label(
-                    f, "Temperature:", f"{data['cpu']['temp']} °C", "°C"
-                ),
-                "freq": lambda f: self.create_label(
-                    f, "Frequency:", f"{data['cpu']['freq']} MHz", "MHz"
-                ),
-                "usage": lambda f: self.create_label(
-                    f, "Usage:", f"{data['cpu']['usage']} %", "%"
-                ),
-            }),
-            ("mem", 1, 1, {
-                "used": lambda f: self.create_label(
-                    f, "Used:", f"{data['mem']['used']} GB", "GB"
-                ),
-                "free": lambda f: self.create_label(
-                    f, "Free:", f"{data['mem']['free']} GB", "GB"
-                ),
-                "percent": lambda f: self.create_label(
-                    f, "Usage:", f"{data['mem']['percent']} %", "%"
-                ),
-            }),
-        ]
-
-        for name, r, c, defs in sections:
+        # Update plan, the (key, label, format) entries to refresh for each section
+        self._section_plans = []
+
+        for name, r, c, specs in SECTION_SPECS:
             section_frame = self.create_gui_section(
                 parent=main_frame,
                 title=name.upper() if name == "cpu" else name.capitalize()
             )
             section_frame.grid(row=r, column=c, padx=5, pady=5, sticky="nsew")
+
+            labels = {}
+            for key, text, suffix, with_icon in specs:
+                value = data[name][key]
+                if with_icon:
+                    labels[key] = self.create_label_with_icon(section_frame, value)
+                else:
+                    labels[key] = self.create_label(section_frame, text, value, suffix)
+
             setattr(self, f"{name}_frame", section_frame)
-            setattr(self, f"{name}_labels", make_labels(section_frame, defs))
+            setattr(self, f"{name}_labels", labels)
+            self._section_plans.append(
+                (name, [(key, label, label.fmt) for key, label in labels.items()])
+            )
 
         self.processes_frame = self.create_gui_section(main_frame, "Top Processes")
         self.processes_frame.grid(row=2, column=0, columnspan=2, padx=5, pady=(5, 0), sticky="nsew")
@@ -290,54 +311,69 @@ class PSMonitorApp(tk.Tk):
         Updates the GUI with the latest data.
         """
 
-        with self._lock:
-            platform_data = self.data["platform"].copy()
-            disk_data = self.data["disk"].copy()
-            cpu_data = self.data["cpu"].copy()
-            mem_data = self.data["mem"].copy()
-            processes_data = self.data["processes"][:]
+        # The websocket client thread doesn't call into Tk, connection failures
+        # are reported here instead
+        failure = self.client.pop_failure()
+        if failure == CONNECTION_EXHAUSTED:
+            self.shutdown()
+            return
+        if failure == CONNECTION_ERROR:
+            self.on_connection_error()
 
-        # Update UI with copies outside the lock
-        self.update_gui_section(self.platform_labels, platform_data)
-        self.update_gui_section(self.disk_labels, disk_data)
-        self.update_gui_section(self.cpu_labels, cpu_data)
-        self.update_gui_section(self.mem_labels, mem_data)
+        self.client.flush_pending()
 
-        self.data["processes"] = processes_data
-        self.update_processes_table()
-        self.graph_handler.update_active_graphs()
+        version = self._data_version
+        if version != self._rendered_version:
+            self._rendered_version = version
+
+            # Sections are left alone while the window is minimized, they are
+            # brought up to date as soon as it is restored, see _on_map()
+            if self.winfo_viewable():
+                self._refresh_sections()
 
+            self.graph_handler.update_active_graphs()
+
+        # Widget updates are rate limited, payloads received in between are dropped
         self.after(
-            ms=self.settings_handler.gui_refresh_interval.get(),
+            ms=max(self.settings_handler.gui_refresh_interval.get(), cfg.MIN_GUI_REFRESH_INTERVAL),
             func=self.update_gui_sections
         )
 
 
-    def update_gui_section(self, labels: dict, data: dict) -> None:
+    def update_gui_section(
+            self,
+            plan: list[tuple[str, ttk.Label, str]],
+            data: dict
+        ) -> list[tuple[ttk.Label, str]]:
         """
-        Updates a section of the GUI.
+        Gets the label updates for a section of the GUI.
+
+        Labels whose value is unchanged since the last update are skipped without
+        formatting, otherwise the text is built from the label's format string.
 
         Args:
-            labels (dict): The labels in the section.
+            plan (list): The (key, label, format) entries for the section.
             data (dict): The data to update.
+
+        Returns:
+            list: The (label, text) pairs for labels whose text has changed.
         """
 
-        for key, value in data.items():
-            if key not in labels:
+        changes = []
+
+        for key, label, fmt in plan:
+            try:
+                value = data[key]
+            except KeyError:
                 continue
 
-            if isinstance(labels[key], tuple):
-                label, suffix = labels[key]
-                new_text = f"{label.prefix} {value} {suffix}".strip()
-            else:
-                label = labels[key]
-                if key == "distro":
-                    new_text = f"{value}".strip()
-                else:
-                    new_text = f"{label.prefix} {value}".strip()
+            if label.last_value == value:
+                continue
+
+            label.last_value = value
+            changes.append((label, fmt.format(value)))
 
-            if label["text"] != new_text:
-                label.config(text=new_text)
+        return changes
 
 
     def create_label(
@@ -346,7 +382,7 @@ class PSMonitorApp(tk.Tk):
             text: str,
             value: str,
             suffix: str = ""
-        ) -> tuple[ttk.Label, str]:
+        ) -> ttk.Label:
         """
         Adds a label to the specified frame.
 
@@ -357,15 +393,16 @@ class PSMonitorApp(tk.Tk):
             suffix (str, optional): The suffix for the label text.
         
         Returns:
-            tuple: The created label and suffix.
+            ttk.Label: The created label.
         """
 
-        label_text = f"{text} {value} {suffix}".strip()
-        label = ttk.Label(frame, text=label_text)
+        fmt = f"{text} {{}} {suffix}".strip()
+        label = ttk.Label(frame, text=fmt.format(value))
         label.grid(sticky="w", padx=5, pady=2)
-        label.prefix = text
+        label.fmt = fmt
+        label.last_value = value
 
-        return label, suffix
+        return label
 
 
     def create_label_with_icon(self, frame: ttk.Frame, value: str) -> ttk.Label:
@@ -383,36 +420,35 @@ class PSMonitorApp(tk.Tk):
         container = ttk.Frame(frame)
         container.grid(sticky="w", padx=5, pady=2)
 
-        platform_key = "linux" if sys.platform == "linux" else "windows"
-        icon = self.platform_icons[platform_key]
-
-        icon_label = ttk.Label(container, image=icon)
-        icon_label.image = icon
+        icon_label = ttk.Label(container, image=self.platform_icon)
+        icon_label.image = self.platform_icon
         icon_label.pack(side="left")
 
         text_label = ttk.Label(container, text=f"{value}")
         text_label.pack(side="left")
+        text_label.fmt = "{}"
+        text_label.last_value = value
 
         return text_label
 
 
-    def load_image(self, path: str, width: int) -> ImageTk.PhotoImage:
+    def load_image(self, path: str) -> tk.PhotoImage:
         """
-        Loads an image from the specified path and resizes it.
+        Loads an image from the specified path.
+
+        Images are displayed at their stored size, icons are pre-sized at build time
+        so they are decoded by Tk directly.
 
         Args:
             path (str): The path to the image file.
-            width (int): The desired width of the image.
         
         Returns:
-            ImageTk.PhotoImage: The loaded and resized image.
+            tk.PhotoImage: The loaded image.
         """
 
         if path in self.image_cache:
             return self.image_cache[path]
-        image = Image.open(path)
-        image = image.resize((width, int(image.height * width / image.width)))
-        photo = ImageTk.PhotoImage(image)
+        photo = tk.PhotoImage(master=self, file=path)
         self.image_cache[path] = photo
 
         return photo
@@ -426,8 +462,12 @@ class PSMonitorApp(tk.Tk):
             frame (ttk.Frame): The parent frame.
         """
 
-        columns = ("pid", "name", "username", "mem")
-        self.processes_tree = ttk.Treeview(frame, columns=columns, show="headings", height=8)
+        self.processes_tree = ttk.Treeview(
+            frame,
+            columns=PROCESS_COLUMNS,
+            show="headings",
+            height=8
+        )
 
         self.processes_tree.heading("pid", text="PID", anchor="center")
         self.processes_tree.column("pid", anchor="center", width=60, minwidth=50)
@@ -438,21 +478,30 @@ class PSMonitorApp(tk.Tk):
         self.processes_tree.heading("mem", text="Memory (MB)", anchor="center")
         self.processes_tree.column("mem", anchor="center", width=80, minwidth=60)
 
+        # Configure the row tags before inserting the rows that use them
+        self.processes_tree.tag_configure("odd", background="lightgrey")
+        self.processes_tree.tag_configure("even", background="white")
+
         # create empty fixed rows
-        for i in range(self.max_process_rows):
+        self._process_iids = tuple(f"proc{i}" for i in range(self.max_process_rows))
+
+        for i, iid in enumerate(self._process_iids):
             tag = "odd" if i % 2 == 0 else "even"
             self.processes_tree.insert(
                 parent="",
                 index="end",
-                iid=f"proc{i}",
-                values=("", "", "", ""),
+                iid=iid,
+                values=EMPTY_PROCESS_ROW,
                 tags=(tag,)
             )
 
-        self.processes_tree.tag_configure("odd", background="lightgrey")
-        self.processes_tree.tag_configure("even", background="white")
         self.processes_tree.pack(expand=True, fill="both", padx=10, pady=10)
 
+        # Rows are updated by calling Tk directly, bypassing Treeview.item()'s
+        # option handling, see update_processes_table()
+        self._tree_call = self.processes_tree.tk.call
+        self._tree_path = str(self.processes_tree)
+
 
     def update_processes_table(self) -> None:
         """
@@ -462,32 +511,57 @@ class PSMonitorApp(tk.Tk):
             processes (list): The list of processes to update.
         """
 
-        for i in range(self.max_process_rows):
-            if i < len(self.data["processes"]):
-                process = self.data["processes"][i]
-                values = (
-                    process.get("pid", ""),
-                    process.get("name", ""),
-                    process.get("username", ""),
-                    process.get("mem", "")
-                )
-            else:
-                values = ("", "", "", "")
+        processes = self.data["processes"]
+
+        pids = self.cached_pids
+        names = self.cached_names
+        usernames = self.cached_usernames
+        mems = self.cached_mems
+
+        tree_call = self._tree_call
+        tree_path = self._tree_path
+
+        for i, iid in enumerate(self._process_iids):
+            try:
+                pid, name, username, mem = PROCESS_VALUES(processes[i])
+            except IndexError:
+                pid, name, username, mem = EMPTY_PROCESS_ROW
+            except KeyError:
+                pid, name, username, mem = (processes[i].get(key, "") for key in PROCESS_COLUMNS)
+
+            # Same process in this row, memory is the only field likely to change
+            if pid == pids[i] and name == names[i] and username == usernames[i]:
+                if mem != mems[i]:
+                    tree_call(tree_path, "set", iid, "mem", mem)
+                    mems[i] = mem
+                continue
 
-            if values != self.cached_processes[i]:
-                self.processes_tree.item(f"proc{i}", values=values)
-                self.cached_processes[i] = values
+            tree_call(tree_path, "item", iid, "-values", (pid, name, username, mem))
+            pids[i] = pid
+            names[i] = name
+            usernames[i] = username
+            mems[i] = mem
 
 
     def open_about_window(self) -> None:
         """
         Displays the "About" window.
+
+        The window is built on first use and hidden when closed, so it is only
+        shown again when reopened.
         """
 
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self._about_window.deiconify()
+            self._about_window.lift()
+            return
+
         about_window = tk.Toplevel(self)
         about_window.title("About PSMonitor")
         about_window.geometry("400x400")
         about_window.resizable(False, False)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
+        self._about_window = about_window
 
         label_version = ttk.Label(
             about_window,
@@ -520,26 +594,6 @@ class PSMonitorApp(tk.Tk):
         license_frame = tk.Frame(about_window, bg="white", bd=2, relief="sunken")
         license_frame.pack(padx=10, pady=10, fill="both", expand=True)
 
-        license_text = (
-            "MIT License\n\n"
-            "Copyright (c) 2025 Chris Rowles\n\n"
-            "Permission is hereby granted, free of charge, to any person obtaining a copy "
-            "of this software and associated documentation files (the \"Software\"), to deal "
-            "in the Software without restriction, including without limitation the rights "
-            "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell "
-            "copies of the Software, and to permit persons to whom the Software is "
-            "furnished to do so, subject to the following conditions:\n\n"
-            "The above copyright notice and this permission notice shall be included in all "
-            "copies or substantial portions of the Software.\n\n"
-            "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR "
-            "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, "
-            "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE "
-            "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER "
-            "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, "
-            "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE "
-            "SOFTWARE."
-        )
-
         text_widget = tk.Text(
             license_frame,
             bg="white",
@@ -547,7 +601,7 @@ class PSMonitorApp(tk.Tk):
             wrap="word",
             font=("Courier", 8)
         )
-        text_widget.insert("1.0", license_text)
+        text_widget.insert("1.0", LICENSE_TEXT)
         text_widget.config(state="disabled")  # Make read-only
         text_widget.pack(fill="both", expand=True, padx=5, pady=5)
 
@@ -564,17 +618,49 @@ class PSMonitorApp(tk.Tk):
         """
         Updates the data in the application.
 
+        Payloads are applied from the refresh tick, see PSMonitorAppClient.flush_pending(),
+        so the data is only ever read and written on the Tk thread.
+
+        The data version is only bumped when a value has changed, so payloads
+        repeating the current data don't trigger a redraw.
+
         Args:
             new_data (dict): The new data to update.
         """
 
-        with self._lock:
-            self.data["cpu"] = new_data.get("cpu", self.data["cpu"])
-            self.data["mem"] = new_data.get("mem", self.data["mem"])
-            self.data["disk"] = new_data.get("disk", self.data["disk"])
-            self.data["user"] = new_data.get("user", self.data["user"])
-            self.data["platform"]["uptime"] = new_data.get("uptime", self.data["uptime"])
-            self.data["processes"] = new_data.get("processes", self.data["processes"])
+        data = self.data
+        changed = False
+
+        for key in REFRESH_KEYS:
+            value = new_data.get(key)
+            if value is not None and value != data.get(key):
+                data[key] = value
+                changed = True
+
+        # Initial data has a platform section, websocket data only has uptime
+        platform = data["platform"]
+        platform_data = new_data.get("platform")
+        if platform_data is not None and any(
+            platform.get(key) != value for key, value in platform_data.items()
+        ):
+            platform.update(platform_data)
+            changed = True
+
+        uptime = new_data.get("uptime")
+        if uptime is not None and uptime != platform.get("uptime"):
+            platform["uptime"] = uptime
+            changed = True
+
+        if changed:
+            self._data_version += 1
+
+
+    def on_connection_error(self) -> None:
+        """
+        Handles a failed connection to the server.
+        """
+
+        self._open_error_window(CONN_ERR_MSG, actions={"restart_server": True})
 
 
     def shutdown(self) -> None:
@@ -582,14 +668,44 @@ class PSMonitorApp(tk.Tk):
         Handles application closing.
         """
 
+        # The client and server each stop their own IOLoop and join its thread
         self.client.close_websocket_connection()
         self.server.stop()
         self.logger.stop()
-        IOLoop.current().add_callback(IOLoop.current().stop)
 
         self.destroy()
 
 
+    def _refresh_sections(self) -> None:
+        """
+        Updates the section labels and the processes table with the latest data.
+        """
+
+        data = self.data
+
+        # Collect the changed labels first and then apply them together in a single pass
+        changes = []
+        for name, plan in self._section_plans:
+            changes += self.update_gui_section(plan, data[name])
+
+        for label, new_text in changes:
+            label.configure(text=new_text)
+
+        self.update_processes_table()
+
+
+    def _on_map(self, event: tk.Event) -> None:
+        """
+        Refreshes the sections when the main window is restored.
+
+        Args:
+            event (tk.Event): The map event, also received for child widgets.
+        """
+
+        if event.widget is self:
+            self._refresh_sections()
+
+
     def _open_error_window(self, error_text: str, actions: dict[str, bool] | None = None):
         """
         Show a popup indicating a blocking error.
@@ -49,8 +49,16 @@ class PSMonitorGraph:
 
         self._index = 0
         self._max_points = 60
-        self._buffer_data = np.zeros(self._max_points)
+        # Percentages and temperatures, single precision is plenty for plotting
+        self._buffer_data = np.zeros(self._max_points, dtype=np.float32)
+        # Preallocated arrays the ring buffer is unrolled into for plotting
+        self._plot_x = np.arange(self._max_points)
+        self._plot_x_scratch = np.empty(self._max_points, dtype=self._plot_x.dtype)
+        self._plot_y_scratch = np.empty(self._max_points, dtype=self._buffer_data.dtype)
         self._data_filled = False
+        self._dirty = False        # buffer changed since the last redraw
+        self._last_sample = None
+        self._repeats = 0          # consecutive samples equal to the last one
         self._data_key = data_key
         self._data_metric = data_metric
         self._y_label = y_label
@@ -63,6 +71,7 @@ class PSMonitorGraph:
         self._g_ax = None     # matplotlib graph
         self._g_canvas = None # matplotlib axis
         self._g_line = None   # matplotlib line
+        self._g_bg = None     # axes background the line is blitted onto
 
 
         self._handler = handler
@@ -74,7 +83,7 @@ class PSMonitorGraph:
         Open graph window.
         """
 
-        if hasattr(self, "_window") and self._window and self._window.winfo_exists():
+        if self._window is not None and self._window.winfo_exists():
             if not self._window.winfo_viewable():
                 self._window.deiconify()
                 # Re-register the graph if needed
@@ -109,11 +118,14 @@ class PSMonitorGraph:
         for spine in self._g_ax.spines.values():
             spine.set_alpha(0.3)
 
-        self._g_line, = self._g_ax.plot([], [], "r-")
+        # The line is animated so full draws leave it out of the captured background
+        self._g_line, = self._g_ax.plot([], [], "r-", animated=True)
+        self._dirty = True
 
         # Create canvas in border frame
         self._g_canvas = FigureCanvasTkAgg(self._g_fig, master=border_frame)
         self._g_canvas.get_tk_widget().pack(expand=True, fill="both", padx=0, pady=0)
+        self._g_canvas.mpl_connect("draw_event", self._on_draw)
         self._g_canvas.draw()
 
         # Register self to graph handler when window opens
@@ -128,10 +140,15 @@ class PSMonitorGraph:
         Loop the graph update using interval from the parent handler.
         """
 
-        if not hasattr(self, "_window") or not self._window.winfo_exists():
+        if self._window is None or not self._window.winfo_exists():
             return  # Stop if window is closed
 
         curr_value = self._sample_data()
+
+        # Keep sampling while the window is minimized, but don't redraw
+        if not self._window.winfo_viewable():
+            return
+
         self._update_plot()
 
         if curr_value is not None:
@@ -146,7 +163,7 @@ class PSMonitorGraph:
         """
         Check if the graph is active
         """
-        return hasattr(self, "_window") and self._window.winfo_exists()
+        return self._window is not None and self._window.winfo_exists()
 
 
     def close_window(self) -> None:
@@ -166,19 +183,17 @@ class PSMonitorGraph:
         self._window.destroy()
 
         # Explicitly clear matplotlib objects to free memory
-        if hasattr(self, "_g_fig"):
+        if self._g_fig is not None:
             self._g_fig.clf()
-            del self._g_fig
-        if hasattr(self, "_g_ax"):
-            del self._g_ax
-        if hasattr(self, "_g_canvas"):
+        if self._g_canvas is not None:
             self._g_canvas.get_tk_widget().destroy()
-            del self._g_canvas
-        if hasattr(self, "_g_line"):
-            del self._g_line
 
-        # Optionally delete the _window reference
-        del self._window
+        self._g_fig = None
+        self._g_ax = None
+        self._g_canvas = None
+        self._g_line = None
+        self._g_bg = None
+        self._window = None
 
 
     def _insert_buffer(self, temp) -> None:
@@ -190,6 +205,15 @@ class PSMonitorGraph:
         self._index += 1
         self._data_filled = self._data_filled or self._index >= self._max_points
 
+        if temp == self._last_sample:
+            self._repeats += 1
+        else:
+            self._last_sample = temp
+            self._repeats = 0
+
+        # The plot only looks the same once the whole window holds one repeated value
+        self._dirty = self._dirty or not (self._data_filled and self._repeats >= self._max_points)
+
 
     def _sample_data(self) -> float | None:
         """
@@ -215,25 +239,45 @@ class PSMonitorGraph:
         Redraw the plot using the current contents of the ring buffer.
         """
 
-        if self._index == 0:
-            return  # no data yet
+        if self._index == 0 or not self._dirty:
+            return  # no data yet, or nothing new to draw
 
-        # Slice actual data range
+        # Slice actual data range, unrolling the ring buffer without allocating
         if self._data_filled:
             offset = self._index % self._max_points
-            y = np.roll(self._buffer_data, -offset)
-            x = np.arange(self._index - self._max_points, self._index)
+            y = np.concatenate(
+                (self._buffer_data[offset:], self._buffer_data[:offset]),
+                out=self._plot_y_scratch
+            )
+            x = np.add(self._plot_x, self._index - self._max_points, out=self._plot_x_scratch)
         else:
             y = self._buffer_data[:self._index]
-            x = np.arange(self._index)
+            x = self._plot_x[:self._index]
 
-        if not np.array_equal(self._g_line.get_ydata(), y):
-            self._g_line.set_data(x, y)
-            if len(x) > 1 and x[0] != x[-1]:
-                self._g_ax.set_xlim(x[0], x[-1])
-            else:
-                self._g_ax.set_xlim(0, self._max_points - 1)
+        self._g_line.set_data(x, y)
+        if len(x) > 1 and x[0] != x[-1]:
+            self._g_ax.set_xlim(x[0], x[-1])
+        else:
+            self._g_ax.set_xlim(0, self._max_points - 1)
+
+        # The x axis has no ticks or grid, so the background doesn't change with
+        # the limits and only the line needs redrawing
+        if self._g_bg is None:
             self._g_canvas.draw_idle()
+        else:
+            self._g_canvas.restore_region(self._g_bg)
+            self._g_ax.draw_artist(self._g_line)
+            self._g_canvas.blit(self._g_ax.bbox)
+        self._dirty = False
+
+
+    def _on_draw(self, _event) -> None:
+        """
+        Capture the axes background after a full draw and draw the line over it.
+        """
+
+        self._g_bg = self._g_canvas.copy_from_bbox(self._g_ax.bbox)
+        self._g_ax.draw_artist(self._g_line)
 
 
 class PSMonitorAppGraphHandler():
@@ -246,7 +290,7 @@ class PSMonitorAppGraphHandler():
         Initialize the graph handler.
         """
 
-        self.active_graphs: list[PSMonitorGraph] = []
+        self.active_graphs: set[PSMonitorGraph] = set()
         self.manager = manager
 
 
@@ -270,8 +314,7 @@ class PSMonitorAppGraphHandler():
         Register a new graph instance.
         """
 
-        if graph not in self.active_graphs:
-            self.active_graphs.append(graph)
+        self.active_graphs.add(graph)
 
 
     def unregister_graph(self, graph: PSMonitorGraph) -> None:
@@ -279,8 +322,7 @@ class PSMonitorAppGraphHandler():
         Unregister an existing graph instance.
         """
 
-        if graph in self.active_graphs:
-            self.active_graphs.remove(graph)
+        self.active_graphs.discard(graph)
 
 
     def update_active_graphs(self) -> None:
@@ -288,8 +330,15 @@ class PSMonitorAppGraphHandler():
         Update active graphs.
         """
 
-        for graph in self.active_graphs[:]:
+        closed = None
+
+        for graph in self.active_graphs:
             if graph.is_active():
                 graph.refresh_graph()
             else:
-                self.unregister_graph(graph)
+                closed = closed or []
+                closed.append(graph)
+
+        # Closed graphs are unregistered after iterating, the set can't change size during it
+        if closed:
+            self.active_graphs.difference_update(closed)
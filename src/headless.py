@@ -12,29 +12,27 @@ License: MIT
 
 # Standard library imports
 import os
-import signal
 
 # Third-party imports
 from tornado.options import define, options, parse_command_line
 from tornado.ioloop import IOLoop
 
 # Local application imports
-from core import signal_handler, create_server
-from core.config import DEFAULT_PORT, set_launch_mode
+from core import create_server, setup_runtime
+from core.config import DEFAULT_ADDRESS, DEFAULT_PORT, set_launch_mode
 from core.auth import write_credentials_file
 from core.logging_manager import PSMonitorLogger
 from core.database_manager import PSMonitorDatabaseManager
 
 
 # Define command-line options
-define("address", default="localhost", help="Listen address for the application")
+define("address", default=DEFAULT_ADDRESS, help="Listen address for the application")
 define("port", default=DEFAULT_PORT, help="Listen port for the application", type=int)
 define("export-credentials", default=False, help="Export connection credentials to file", type=bool)
 
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    setup_runtime()
 
     set_launch_mode("headless")
 